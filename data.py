@@ -1,5 +1,8 @@
 import pandas as pd
 
+# Beginning of the summary of automatically filled category pages
+AUTO_CATEGORY_PREFIX = "В эту категорию автоматически"
+
 
 def clear_data(data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -16,27 +19,29 @@ def clear_data(data: pd.DataFrame) -> pd.DataFrame:
         Cleared Pandas DataFrame with wiki infobox.
     """
     # Replacing the nan values
-    data[data["plot"].isnull()] = "no info"
-    data[data["genre"].isnull()] = "no info"
+    data[["plot", "genre"]] = data[["plot", "genre"]].fillna("no info")
 
-    # Replacing the nan values
-    data.dropna(subset=["summary"], inplace=True)
+    summary = data["summary"].to_numpy()
 
     # Throwing out lines with nan in the summary
-    data.drop(
-        data[data["summary"].str.contains("В эту категорию автоматически")].index,
-        inplace=True,
-        axis=0
-    )
-
-    # Throwing out lines with "no info" in each column
-    cond = True
-    for col_name in data.columns.values:
-        cond &= data[col_name] == "no info"
-    data.drop(data[cond].index, axis=0, inplace=True)
-
-    # Resetting indexes
-    data.reset_index(drop=True, inplace=True)
-
-    # Rearranging the columns
-    return data[["title", "type", "genre", "imdb_rating", "summary", "plot"]]
+    keep = pd.notna(summary)
+
+    # Throwing out category pages
+    keep &= ~data["summary"].str.startswith(AUTO_CATEGORY_PREFIX, na=False).to_numpy()
+
+    # Throwing out lines with "no info" in each column, missing ratings are NA
+    values = data.to_numpy(dtype=object)
+    no_info = pd.isna(values)
+    no_info[~no_info] = values[~no_info] == "no info"
+    keep &= ~no_info.all(axis=1)
+
+    # Rearranging the columns and resetting indexes
+    data = data.loc[
+        keep, ["title", "type", "genre", "imdb_rating", "summary", "plot"]
+    ].reset_index(drop=True)
+
+    # Columns with few distinct values are stored as categories
+    data["type"] = data["type"].astype("category")
+    data["genre"] = data["genre"].astype("category")
+
+    return data
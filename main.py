@@ -1,8 +1,11 @@
+import csv
+import os
 import wikipediaapi
-from datetime import datetime
+import pandas as pd
 
 from data import clear_data
-from parser import extract_film_data, create_and_save_dataset
+from parser import extract_film_data, create_and_save_dataset, FILM_DATA_COLUMNS
+from timing import stage
 
 # Wiki object
 wiki_wiki = wikipediaapi.Wikipedia(
@@ -29,43 +32,92 @@ type_names = [
     "animated series",
 ]
 
-# Defining variables for data storage
-all_titles = []
-all_types_names = []
-all_urls = []
-all_summaries = []
-all_plots = []
-
-# Sorting through the categories and extracting data from each film contained in them
-
-# Starting the timer
-start_time = datetime.now()
-
-for ind, category in enumerate(categories):
-    cat = wiki_wiki.page(category)
-    new_film_data = extract_film_data(cat.categorymembers, type_names[ind])
-    all_titles += new_film_data[0]
-    all_types_names += new_film_data[1]
-    all_urls += new_film_data[2]
-    all_summaries += new_film_data[3]
-    all_plots += new_film_data[4]
-
-elapsed_time = (datetime.now() - start_time).seconds
-mins, secs = divmod(elapsed_time, 60)
-hours, mins = divmod(mins, 60)
-print(f"Elapsed time: {hours} h {mins} min {secs} sec")
-
-# Creating dataset
-data = create_and_save_dataset(
-    all_titles,
-    all_types_names,
-    all_urls,
-    all_summaries,
-    all_plots,
-)
+# Rows are written to disk as they are parsed and flushed every 1000 rows
+raw_path = "films_raw.csv"
+flush_every = 1000
+
+
+def drop_incomplete_row(path: str, chunk_size: int = 1 << 16) -> None:
+    """
+    Truncates the CSV file after its last complete row.
+
+    A crash while writing leaves a cut row at the end of the file. The csv module
+    ends rows with "\r\n", while the page texts only contain "\n".
+
+    Parameters
+    ----------
+    path : str
+        The path to the CSV file.
+    chunk_size : int
+        Size of the chunks in which the file is read from the end.
+    """
+    with open(path, "rb+") as file:
+        end = file.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - chunk_size)
+            file.seek(start)
+            # One more byte to find "\r\n" crossing the chunk boundary
+            position = file.read(end - start + 1).rfind(b"\r\n")
+            if position >= 0:
+                file.truncate(start + position + 2)
+                return
+            end = start
+        file.truncate(0)
+
+
+# Running only as a script, the processes parsing pages import this module
+if __name__ == "__main__":
+    # Titles parsed in previous runs are not requested again in the same category,
+    # a film from several categories is written for each of them as in a fresh run
+    done_titles = {}
+    if os.path.exists(raw_path):
+        drop_incomplete_row(raw_path)
+    if os.path.exists(raw_path) and os.path.getsize(raw_path) > 0:
+        done = pd.read_csv(
+            raw_path,
+            usecols=["title", "type"],
+            keep_default_na=False,
+            on_bad_lines="skip",
+        )
+        done_titles = {
+            type_name: set(titles)
+            for type_name, titles in done.groupby("type")["title"]
+        }
+
+    # Sorting through the categories and extracting data from each film in them
+    with stage("categories"):
+        with open(raw_path, "a", newline="", encoding="utf-8") as raw_file:
+            writer = csv.DictWriter(raw_file, fieldnames=FILM_DATA_COLUMNS)
+            if raw_file.tell() == 0:
+                writer.writeheader()
+
+            for ind, category in enumerate(categories):
+                with stage(f"category {type_names[ind]}"):
+                    cat = wiki_wiki.page(category)
+                    film_data = extract_film_data(
+                        cat.categorymembers,
+                        type_names[ind],
+                        done_titles.get(type_names[ind]),
+                    )
+                    for row_number, row in enumerate(film_data, 1):
+                        writer.writerow(row)
+                        if row_number % flush_every == 0:
+                            raw_file.flush()
+
+    # Creating dataset
+    data = create_and_save_dataset(
+        pd.read_csv(raw_path, keep_default_na=False, on_bad_lines="skip"),
+    )
 
-# Clearing data
-data = clear_data(data)
+    # Clearing data
+    with stage("clearing"):
+        data = clear_data(data)
 
-# Exporting a data frame to csv format
-data.to_csv("films_wiki_data_in_russian.csv", index=False)
+    # Exporting a data frame to parquet format
+    with stage("saving cleared dataset"):
+        data.to_parquet(
+            "films_wiki_data_in_russian.parquet",
+            engine="pyarrow",
+            compression="zstd",
+            index=False,
+        )
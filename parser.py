@@ -1,218 +1,577 @@
-from typing import Union, Tuple, List, Any
+from typing import Union, Tuple, List, Any, Optional, Dict, Iterator, AsyncIterator
 
+import asyncio
+import json
+import multiprocessing
+import os
 import wikipediaapi
+import aiohttp
+import diskcache
 import pandas as pd
-import re
 
-from tqdm import tqdm
-from imdbparser import IMDb
-from pandas.io.html import read_html
+from concurrent.futures import ProcessPoolExecutor
+
+from tqdm.asyncio import tqdm as async_tqdm
+from selectolax.parser import HTMLParser
+from timing import stage
+
+# MediaWiki API of the Russian Wikipedia
+WIKI_API_URL = "https://ru.wikipedia.org/w/api.php"
+HEADERS = {"User-Agent": "MyProjectName (merlin@example.com)"}
+
+# Columns of the rows extracted from category pages
+FILM_DATA_COLUMNS = ["title", "type", "url", "summary", "plot"]
+
+# IMDb GraphQL API, it refuses requests without a browser-like User-Agent
+IMDB_GRAPHQL_URL = "https://caching.graphql.imdb.com/"
+IMDB_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/117.0",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+# IMDb id is the number in the infobox row like "ID 0111161"
+IMDB_ID_PATTERN = r"(\d+)"
+# Runs of everything except letters in genres. Needs Python re on object dtype:
+# on pyarrow strings RE2 treats \W as ASCII and would match Cyrillic letters
+NON_ALPHA_PATTERN = r"[\d\W_]+"
+# Ratings are requested for up to 100 titles at once
+IMDB_RATINGS_QUERY = (
+    "query Ratings($ids: [ID!]!) "
+    "{ titles(ids: $ids) { id ratingsSummary { aggregateRating } } }"
+)
+IMDB_BATCH_SIZE = 100
+
+# Cache for infoboxes and ratings between runs, entries live for 7 days
+CACHE = diskcache.Cache("./.wiki_cache")
+CACHE_EXPIRE = 7 * 24 * 60 * 60
+
+# Failed IMDb ids are kept in the cache too and not requested again for 10 minutes
+FAILED_TTL = 10 * 60
+
+# Limits for concurrent requests
+MAX_CONCURRENCY = 64
+IMDB_CONCURRENCY = 16
+MAX_RETRIES = 5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+# Pages downloaded but not parsed yet, limits the HTML kept in memory
+MAX_PAGES_IN_FLIGHT = 128
+
+
+async def fetch_text(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    payload: Optional[Dict] = None,
+) -> str:
+    """
+    Performs a request, retrying with exponential backoff on 429 and 5xx responses,
+    dropped connections and timeouts.
 
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Shared HTTP session.
+    url : str
+        Requested url.
+    params : dict, optional
+        Query string parameters.
+    headers : dict, optional
+        Headers replacing the session ones.
+    payload : dict, optional
+        JSON body, if passed the request is sent with POST instead of GET.
 
-def extract_infobox(url: str) -> pd.DataFrame:
+    Returns
+    -------
+    str
+        Response body.
+    """
+    method = "GET" if payload is None else "POST"
+    for attempt in range(MAX_RETRIES):
+        last_attempt = attempt == MAX_RETRIES - 1
+        retry_after = ""
+        try:
+            async with session.request(
+                method, url, params=params, headers=headers, json=payload
+            ) as response:
+                if response.status not in RETRY_STATUSES or last_attempt:
+                    response.raise_for_status()
+                    return await response.text()
+                retry_after = response.headers.get("Retry-After", "")
+        except RETRY_ERRORS:
+            if last_attempt:
+                raise
+
+        # Waiting as long as the server asks, otherwise 1, 2, 4... seconds
+        delay = int(retry_after) if retry_after.isdigit() else 2**attempt
+        await asyncio.sleep(delay)
+
+
+def split_sections(extract: str) -> Tuple[str, Dict[str, str]]:
     """
-    Extracts the infobox from the wiki page and presents it in Pandas dataframe format.
+    Splits the plain text of the wiki page into the summary and sections.
 
     Parameters
     ----------
-    url : str
-        Link to wikipedia page.
+    extract : str
+        Plain text of the wiki page with "== Title ==" headings.
 
     Returns
     -------
-    Pandas DataFrame
-        Pandas DataFrame with wiki infobox.
+    tuple
+        Tuple with the summary and texts of the second level sections by titles.
     """
-    # If the exception is triggered, it will return "not found"
-    infobox = "not found"
-    try:
-        infobox = read_html(url, attrs={"class": "infobox"})[0]
-    except ValueError:
-        pass
+    # The summary is the text before the first heading, subsections stay in sections
+    summary, *parts = extract.split("\n== ")
 
-    return infobox
+    sections = {}
+    for part in parts:
+        heading, _, text = part.partition("\n")
+        sections.setdefault(heading.rstrip("= ").strip(), text.strip())
 
+    return summary.strip(), sections
 
-def extract_from_infobox(infobox) -> str:
+
+async def fetch_page(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, title: str
+) -> Optional[Tuple[str, str, str, str]]:
     """
-    Retrieves the IMDb ID and genres in infobox.
+    Fetches url, summary and plot of the wiki page from the MediaWiki API.
 
     Parameters
     ----------
-    infobox : pd.DataFrame
-        Pandas DataFrame with wiki infobox.
+    session : aiohttp.ClientSession
+        Shared HTTP session.
+    semaphore : asyncio.Semaphore
+        Semaphore limiting the number of concurrent requests.
+    title : str
+        Title of the wiki page.
 
     Returns
     -------
-    genre, imdb_id : str, str
-        Strings with genres and id or empty strings.
+    tuple or None
+        Tuple with title, url, summary and plot or None if the page failed to load.
     """
-    genre = ""
-    imdb_id = ""
-    if infobox.shape[1] == 2:
-        col_1, col_2 = infobox.columns
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "prop": "extracts|info",
+        "inprop": "url",
+        "explaintext": 1,
+        "exsectionformat": "wiki",
+        "titles": title,
+    }
+    try:
+        async with semaphore:
+            response = await fetch_text(session, WIKI_API_URL, params)
+        page = json.loads(response)["query"]["pages"][0]
+    except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, ValueError):
+        return None
 
-        try:
-            genre = infobox.loc["Жанр" == infobox[col_1], col_2].values[0]
-        except (ValueError, IndexError):
-            pass
+    # Invalid titles come back without url, only with the reason
+    url = page.get("fullurl")
+    if url is None:
+        return None
 
-        try:
-            imdb_id = infobox.loc["IMDb" == infobox[col_1], col_2].values[0]
-        except (ValueError, IndexError):
-            pass
+    # Only "\n" line breaks, "\r\n" marks the end of a row in the raw CSV
+    extract = page.get("extract", "").replace("\r\n", "\n")
+    summary, sections = split_sections(extract)
+
+    # Looking for a section with a plot, "no info", if not found
+    return title, url, summary, sections.get("Сюжет", "no info")
+
+
+async def iter_pages(titles: List[str]) -> AsyncIterator[Tuple[str, str, str, str]]:
+    """
+    Concurrently fetches the wiki pages and yields them as they are loaded.
+
+    A fixed pool of workers takes titles one by one and puts the pages into a
+    bounded queue, so only a few loaded pages are kept in memory at once.
+
+    Parameters
+    ----------
+    titles : list
+        List with titles of the wiki pages.
 
-        # Extracting IMDb id
-        if imdb_id != "":
-            matches = re.findall(r"\d+", imdb_id)
-            imdb_id = matches[0] if len(imdb_id) > 0 else ""
+    Yields
+    ------
+    tuple
+        Tuple with title, url, summary and plot, failed pages are skipped.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    results: asyncio.Queue = asyncio.Queue(maxsize=MAX_CONCURRENCY)
+    remaining_titles = iter(titles)
 
-    return genre, imdb_id
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
 
+        async def worker() -> None:
+            try:
+                for title in remaining_titles:
+                    await results.put(await fetch_page(session, semaphore, title))
+            except Exception as error:
+                # Passing unexpected errors on instead of leaving the consumer waiting
+                await results.put(error)
 
-def extract_imdb_rating(imdb_id) -> Union[int, str]:
+        workers = [asyncio.ensure_future(worker()) for _ in range(MAX_CONCURRENCY)]
+        try:
+            with async_tqdm(total=len(titles)) as pbar:
+                for _ in range(len(titles)):
+                    page = await results.get()
+                    pbar.update(1)
+                    if isinstance(page, Exception):
+                        raise page
+                    if page is not None:
+                        yield page
+        finally:
+            # Stopping the remaining requests if the consumer stops early
+            for task in workers:
+                task.cancel()
+
+
+async def fetch_html(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str
+) -> Optional[str]:
     """
-    Extracts the rating from the movie page on IMDb.
+    Downloads the HTML of the wiki page.
 
     Parameters
     ----------
-    imdb_id : str
-        String with IMDb id.
+    session : aiohttp.ClientSession
+        Shared HTTP session.
+    semaphore : asyncio.Semaphore
+        Semaphore limiting the number of concurrent requests to Wikipedia.
+    url : str
+        Link to wikipedia page.
 
     Returns
     -------
-    rating : str, str
-        Float value of rating or "no info".
+    str or None
+        HTML of the page or None if the page failed to load.
     """
-    imdb = IMDb()
     try:
-        # Extracting movie rating
-        movie = imdb.get_movie(imdb_id)
-        movie.fetch()
-        rating = movie.__dict__.get("rating", "no info")
-        rating = "no info" if rating == 0 else rating
-    except IndexError:
-        rating = "no info"
+        async with semaphore:
+            return await fetch_text(session, url)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
 
-    try:
-        return float(rating)
-    except ValueError:
-        return "no info"
 
+def extract_infobox(html: str) -> Dict[str, str]:
+    """
+    Extracts the infobox from the wiki page and presents it as a dict.
+
+    Parameters
+    ----------
+    html : str
+        HTML of the wiki page.
+
+    Returns
+    -------
+    dict
+        Values of the infobox rows by their labels, empty if there is no infobox.
+    """
+    # Only rows with both a label and a value are taken. Text nodes are joined with
+    # spaces, so values split by <br> do not merge, and the spaces are collapsed
+    infobox = {}
+    for row in HTMLParser(html).css("table.infobox tr"):
+        label, value = row.css_first("th"), row.css_first("td")
+        if label is not None and value is not None:
+            infobox.setdefault(
+                " ".join(label.text(separator=" ").split()),
+                " ".join(value.text(separator=" ").split()),
+            )
+
+    return infobox
+
+
+def extract_from_infobox(infobox: Dict[str, str]) -> Tuple[str, str]:
+    """
+    Retrieves the IMDb ID and genres in infobox.
+
+    Parameters
+    ----------
+    infobox : dict
+        Values of the wiki infobox rows by their labels.
 
-def extract_film_data(category_members: Any, type_name: str) -> Tuple[List[str], ...]:
+    Returns
+    -------
+    genre, imdb_id : str, str
+        Raw texts of the genre and IMDb rows or empty strings.
+    """
+    return infobox.get("Жанр", ""), infobox.get("IMDb", "")
+
+
+async def extract_imdb_ratings(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, imdb_ids: List[str]
+) -> Dict[str, Union[float, str]]:
+    """
+    Extracts the ratings of a batch of movies from IMDb with one request.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Shared HTTP session.
+    semaphore : asyncio.Semaphore
+        Semaphore limiting the number of concurrent requests to IMDb.
+    imdb_ids : list
+        List with IMDb ids.
+
+    Returns
+    -------
+    dict
+        Float values of ratings or "no info" by IMDb id.
+    """
+    ratings = {}
+    missing_ids = []
+    for imdb_id in imdb_ids:
+        if ("imdb_failed", imdb_id) in CACHE:
+            ratings[imdb_id] = "no info"
+        elif ("imdb", imdb_id) in CACHE:
+            ratings[imdb_id] = CACHE[("imdb", imdb_id)]
+        else:
+            missing_ids.append(imdb_id)
+
+    if not missing_ids:
+        return ratings
+
+    payload = {
+        "query": IMDB_RATINGS_QUERY,
+        "variables": {"ids": [f"tt{imdb_id}" for imdb_id in missing_ids]},
+    }
+    try:
+        async with semaphore:
+            response = await fetch_text(
+                session, IMDB_GRAPHQL_URL, headers=IMDB_HEADERS, payload=payload
+            )
+        body = json.loads(response)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        body = None
+
+    # Error responses may come with null data or only a part of the titles
+    failed = not isinstance(body, dict) or "errors" in body
+    data = body.get("data") if isinstance(body, dict) else None
+    titles = (data or {}).get("titles") or []
+
+    # Unknown titles are returned as null, titles without votes have no rating
+    found = {}
+    for title in titles:
+        if isinstance(title, dict) and title.get("id"):
+            summary = title.get("ratingsSummary") or {}
+            found[title["id"][2:]] = summary.get("aggregateRating")
+    for imdb_id in missing_ids:
+        # Failures are remembered separately with a short expiry
+        if failed and imdb_id not in found:
+            CACHE.set(("imdb_failed", imdb_id), True, expire=FAILED_TTL)
+            ratings[imdb_id] = "no info"
+            continue
+
+        rating = found.get(imdb_id)
+        rating = "no info" if rating is None else float(rating)
+        ratings[imdb_id] = rating
+        CACHE.set(("imdb", imdb_id), rating, expire=CACHE_EXPIRE)
+
+    return ratings
+
+
+def extract_film_data(
+    category_members: Any, type_name: str, skip_titles: Optional[set] = None
+) -> Iterator[Dict[str, str]]:
     """
     Extracts films titles, types_names, urls, summaries, plots from wiki.
 
     Parameters
     ----------
     category_members : Any
-        String with IMDb id.
+        Members of the wiki category.
     type_name : str
         The name of the category that will be parsed.
+    skip_titles : set, optional
+        Titles that are already extracted and should not be requested.
 
-    Returns
-    -------
-    tuple
-        Tuple with lists of titles, types_names, urls, summaries, plots.
-    """
-    titles = []
-    types_names = []
-    urls = []
-    summaries = []
-    plots = []
-
-    i = 0
-    cat_members_values = list(category_members.values())
-    n = len(cat_members_values)
-    with tqdm(total=n) as pbar:
-        while i < n:
-            page = cat_members_values[i]
-            # If page is not a subcategory
-            if page.ns != wikipediaapi.Namespace.CATEGORY:
-                exception_flag = False
+    Yields
+    ------
+    dict
+        Row with title, type, url, summary and plot of the film.
+    """
+    skip_titles = skip_titles or set()
+
+    # Subcategories are skipped
+    titles = [
+        page.title
+        for page in category_members.values()
+        if page.ns != wikipediaapi.Namespace.CATEGORY and page.title not in skip_titles
+    ]
+
+    # Pages are fetched in a separate event loop and handed over one by one
+    loop = asyncio.new_event_loop()
+    pages = iter_pages(titles)
+    try:
+        while True:
             try:
-                title = page.title
-                url = page.fullurl
-                summary = page.summary
-
-                # Looking for a section with a plot
-                plot_section = page.section_by_title("Сюжет")
-
-                # "no info", if not found
-                if plot_section is None:
-                    plot = "no info"
-                else:
-                    plot = plot_section.text
-            except RuntimeError:
-                exception_flag = True
-
-            if exception_flag:
-                continue
-            else:
-                titles.append(title)
-                types_names.append(type_name)
-                urls.append(url)
-                summaries.append(summary)
-                plots.append(plot)
-                i += 1
-                pbar.update(1)
+                title, url, summary, plot = loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                break
 
-    return titles, types_names, urls, summaries, plots
+            yield dict(zip(FILM_DATA_COLUMNS, (title, type_name, url, summary, plot)))
+    finally:
+        loop.run_until_complete(pages.aclose())
+        loop.close()
 
 
-def extract_info_by_url(url: str) -> Tuple[List[str], ...]:
+def parse_infobox(html: str) -> Tuple[str, str]:
     """
-    Extracts genre and rating from wiki page.
+    Extracts genre and IMDb id from the HTML of the wiki page.
 
     Parameters
     ----------
-    url : str
-        Link to wikipedia page.
+    html : str
+        HTML of the wiki page.
 
     Returns
     -------
     tuple
-        Tuple with lists of genres and ratings.
+        Tuple with genre and IMDb id.
     """
     # Getting an infobox
-    infobox = extract_infobox(url)
+    infobox = extract_infobox(html)
 
     # If the table exists, then imdb_id and genres are extracted
-    if type(infobox) != pd.core.frame.DataFrame:
-        genre, imdb_id = "no info", ""
-    else:
-        genre, imdb_id = extract_from_infobox(infobox)
-        # Removing numbers and characters from a string
-        genre = "".join(char for char in genre if char.isalpha() or char.isspace())
+    if not infobox:
+        return "no info", ""
 
-    rating = extract_imdb_rating(imdb_id)
-    return genre, rating
+    return extract_from_infobox(infobox)
+
+
+async def extract_infos(
+    session: aiohttp.ClientSession, urls: List[str]
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Extracts genres and IMDb ids from wiki pages.
+
+    Each page is parsed in the process pool as soon as it is downloaded.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Shared HTTP session.
+    urls : list
+        List with links to Wikipedia pages.
+
+    Returns
+    -------
+    dict
+        Tuples with genre and IMDb id by url.
+    """
+    infos = {}
+    for url in urls:
+        info = CACHE.get(("infobox", url))
+        if info is not None:
+            infos[url] = info
+
+    missing_urls = list(dict.fromkeys(url for url in urls if url not in infos))
+    if not missing_urls:
+        return infos
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    in_flight = asyncio.Semaphore(MAX_PAGES_IN_FLIGHT)
+    loop = asyncio.get_running_loop()
+
+    # Workers are spawned, forking inside the event loop would copy its running
+    # threads (resolver, tqdm monitor) and could deadlock the children
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+
+        async def extract_info(url: str) -> Tuple[str, Optional[Tuple[str, str]]]:
+            async with in_flight:
+                html = await fetch_html(session, semaphore, url)
+                if html is None:
+                    return url, None
+                return url, await loop.run_in_executor(pool, parse_infobox, html)
+
+        tasks = [asyncio.ensure_future(extract_info(url)) for url in missing_urls]
+        for task in async_tqdm.as_completed(tasks):
+            url, info = await task
+
+            # Pages that failed to load get no info and are not cached
+            if info is None:
+                infos[url] = ("no info", "")
+            else:
+                infos[url] = info
+                CACHE.set(("infobox", url), info, expire=CACHE_EXPIRE)
+
+    return infos
+
+
+async def extract_genres_and_ratings(urls: List[str]) -> Tuple[pd.Series, ...]:
+    """
+    Concurrently extracts genres from wiki pages and ratings from IMDb.
+
+    Parameters
+    ----------
+    urls : list
+        List with links to Wikipedia pages.
+
+    Returns
+    -------
+    tuple
+        Tuple with series of raw genres and ratings.
+    """
+    imdb_semaphore = asyncio.Semaphore(IMDB_CONCURRENCY)
+    # Connections to both hosts are kept alive and reused
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENCY + IMDB_CONCURRENCY, limit_per_host=MAX_CONCURRENCY
+    )
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        with stage("infoboxes"):
+            info_by_url = await extract_infos(session, urls)
+        infos = pd.DataFrame(
+            [info_by_url[url] for url in urls],
+            columns=["genre", "imdb_id"],
+            dtype=object,
+        )
+
+        # Extracting IMDb ids from rows like "ID 0111161", in one pass for all pages
+        page_ids = infos["imdb_id"].str.extract(IMDB_ID_PATTERN, expand=False)
+
+        # Each IMDb id is requested only once, in batches
+        imdb_ids = list(page_ids.dropna().unique())
+        with stage("imdb ratings"):
+            batches = await async_tqdm.gather(
+                *[
+                    extract_imdb_ratings(
+                        session, imdb_semaphore, imdb_ids[i : i + IMDB_BATCH_SIZE]
+                    )
+                    for i in range(0, len(imdb_ids), IMDB_BATCH_SIZE)
+                ]
+            )
+
+    rating_by_id = {}
+    for batch in batches:
+        rating_by_id.update(batch)
+
+    # Ratings that are not found become NA
+    ratings = pd.to_numeric(page_ids.map(rating_by_id), errors="coerce")
+
+    return infos["genre"], ratings.astype("Float64")
 
 
 def create_and_save_dataset(
-    titles: List[str],
-    types_names: List[str],
-    urls: List[str],
-    summaries: List[str],
-    plots: List[str],
-    path: str = "films_data_in_russian.csv",
+    data: pd.DataFrame,
+    path: str = "films_data_in_russian.parquet",
 ):
     """
     Extracts genre and rating from wiki page.
 
     Parameters
     ----------
-    titles : list
-        List with titles.
-    types_names : list
-        List with type names like film, tv series, etc.
-    urls : list
-        List with links to Wikipedia pages.
-    summaries : list
-        List with summaries.
-    plots : list
-        List with plots.
+    data : pd.DataFrame
+        Data with title, type, url, summary and plot columns.
     path : str
         The path to save data.
 
@@ -221,30 +580,31 @@ def create_and_save_dataset(
     Pandas DataFrame
         DataFrame with films data.
     """
-    data = pd.DataFrame(
-        {
-            "title": titles,
-            "type": types_names,
-            "url": urls,
-            "summary": summaries,
-            "plot": plots,
-        }
+    # Pages are saved in the order they load, sorting makes the dataset reproducible
+    data = data[FILM_DATA_COLUMNS].sort_values(
+        ["type", "title"], kind="stable", ignore_index=True
     )
-    genres = []
-    ratings = []
+
     # Extracting genres and ratings
-    with tqdm(total=data.shape[0]) as pbar:
-        for url in data["url"].values:
-            genre, rating = extract_info_by_url(url)
-            genres.append(genre)
-            ratings.append(rating)
-            pbar.update(1)
+    with stage("enrichment"):
+        genres, ratings = asyncio.run(
+            extract_genres_and_ratings(data["url"].to_numpy())
+        )
 
     # Adding additional columns to the DataFrame
-    data.insert(1, "genre", genres)
-    data.insert(2, "imdb_rating", ratings)
+    data.insert(1, "genre", genres.to_numpy())
+    # Replacing numbers and characters in genres with spaces
+    data["genre"] = (
+        data["genre"]
+        .astype(object)
+        .str.replace(NON_ALPHA_PATTERN, " ", regex=True)
+        .str.strip()
+    )
+    data.insert(2, "imdb_rating", ratings.array)
 
-    # Exporting a data frame to csv format
-    data.to_csv(path, index=False)
+    # Storing columns in Arrow memory and exporting to compressed parquet
+    data = data.convert_dtypes(dtype_backend="pyarrow")
+    with stage("saving dataset"):
+        data.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
 
     return data
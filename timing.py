@@ -0,0 +1,34 @@
+import json
+import time
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+# Timings of all runs are appended to one file, the run is marked by its start
+TIMINGS_PATH = "timings.jsonl"
+RUN_ID = datetime.now().isoformat(timespec="seconds")
+
+
+@contextmanager
+def stage(name: str, path: str = TIMINGS_PATH) -> Iterator[None]:
+    """
+    Measures the execution time of the stage, prints it and logs it to a JSONL file.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage.
+    path : str
+        The path to the JSONL file with timings.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {elapsed:.3f}s")
+
+        record = {"run": RUN_ID, "stage": name, "seconds": round(elapsed, 3)}
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")